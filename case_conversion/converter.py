@@ -1,6 +1,91 @@
-from typing import List, Optional
-
-from .parser import parse_case
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .parser import _parse_case_cached
+
+# Lower- or upper-case ASCII words joined by single separators convert to
+# the delimited styles by just swapping the separators (and case).
+_IS_LOWER_WORDS = re.compile(r"[a-z0-9]+(?:[-_. /\\][a-z0-9]+)*").fullmatch
+_IS_UPPER_WORDS = re.compile(r"[A-Z0-9]+(?:[-_. /\\][A-Z0-9]+)*").fullmatch
+_SEPARATORS = "-_. /\\"
+# A single run of lower-case ASCII letters and digits (digits alone included)
+# is its own camelCase and only needs its first letter upper-cased for
+# PascalCase.
+_IS_LOWER_ALNUM = re.compile(r"[a-z0-9]+").fullmatch
+# Without acronyms, the words of an ASCII text are its runs of lower-case
+# letters and digits, each optionally led by one upper-case letter (or, if
+# the text is all upper-case, its runs of letters and digits).
+_HAS_NON_ASCII = re.compile(r"[^\x00-\x7f]").search
+_FIND_WORDS = re.compile(r"[A-Z][a-z0-9]*|[a-z0-9]+").findall
+_FIND_UPPER_WORDS = re.compile(r"[A-Z0-9]+").findall
+
+
+def _replace_separators(text: str, separator: str) -> str:
+    for sep in _SEPARATORS:
+        if sep != separator:
+            text = text.replace(sep, separator)
+    return text
+
+
+def _normalized_words(
+    text: str, acronyms: Tuple[str, ...], capitalize: bool = True
+) -> Sequence[str]:
+    """Return the normalized words of text, as parse_case does.
+
+    ASCII text without acronyms is split by a single regex instead of the
+    full parser. Words without lower-case letters are dropped, just like
+    normalize_words does, which also makes acronym detection moot. Callers
+    that re-case the words anyway can skip capitalizing them with
+    capitalize=False; this only ever affects ASCII words.
+    """
+    if acronyms or _HAS_NON_ASCII(text):
+        return _parse_case_cached(text, acronyms)[0]
+    if text.isupper():
+        words = _FIND_UPPER_WORDS(text)
+    else:
+        words = [w for w in _FIND_WORDS(text) if not w.isupper()]
+    if capitalize:
+        return [w.capitalize() for w in words]
+    return words
+
+
+@lru_cache(maxsize=4096)
+def _join_cased(
+    text: str,
+    acronyms: Tuple[str, ...],
+    separator: str,
+    case_fn: Optional[Callable[[str], str]] = None,
+    preserve_case: bool = False,
+) -> str:
+    """Return the parsed words of text re-cased and joined, memoized.
+
+    This is the single formatting kernel of all styles that join their
+    words with a separator. Words are re-cased with case_fn, or joined as
+    parsed if it is None. Caches the rendered result per style, so repeated
+    conversions of the same text are a single lookup.
+    """
+    if preserve_case:
+        return separator.join(_parse_case_cached(text, acronyms)[1])
+    if case_fn is None:
+        return separator.join(_normalized_words(text, acronyms))
+    normalized = _normalized_words(text, acronyms, capitalize=False)
+    if case_fn is str.capitalize:
+        return separator.join(map(case_fn, normalized))
+    # Re-case all words in a single pass over the joined text. They are
+    # joined on NUL first: it is neither cased nor case-ignorable, so, like
+    # the end of a word, it bounds the context of context-sensitive mappings
+    # such as the Greek final sigma. Some separators, e.g. ".", don't.
+    return case_fn("\0".join(normalized)).replace("\0", separator)
+
+
+@lru_cache(maxsize=4096)
+def _camel(text: str, acronyms: Tuple[str, ...]) -> str:
+    """Return text in camelCase style, memoized."""
+    words = _normalized_words(text, acronyms)
+    if not words:
+        return ""
+    return words[0].lower() + "".join(words[1:])
 
 
 def camel(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -19,10 +104,10 @@ def camel(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> camel("HELLO_HTML_WORLD", ["HTML"])
         'helloHTMLWorld'
     """
-    words, *_ = parse_case(text, acronyms)
-    if words:
-        words[0] = words[0].lower()
-    return "".join(words)
+    if not acronyms and _IS_LOWER_ALNUM(text):
+        # Return a plain str, like the other styles, even for str subclasses.
+        return str.__str__(text)
+    return _camel(text, tuple(acronyms or ()))
 
 
 def pascal(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -43,8 +128,9 @@ def pascal(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> pascal("HELLO_HTML_WORLD", ["HTML"])
         'HelloHTMLWorld'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "".join(words)
+    if not acronyms and _IS_LOWER_ALNUM(text):
+        return text.capitalize()
+    return _join_cased(text, tuple(acronyms or ()), "")
 
 
 def snake(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -63,8 +149,9 @@ def snake(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> snake("HelloHTMLWorld", ["HTML"])
         'hello_html_world'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "_".join([w.lower() for w in words])
+    if not acronyms and _IS_LOWER_WORDS(text):
+        return _replace_separators(text, "_")
+    return _join_cased(text, tuple(acronyms or ()), "_", str.lower)
 
 
 def dash(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -85,8 +172,9 @@ def dash(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> dash("HelloHTMLWorld", ["HTML"])
         'hello-html-world'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "-".join([w.lower() for w in words])
+    if not acronyms and _IS_LOWER_WORDS(text):
+        return _replace_separators(text, "-")
+    return _join_cased(text, tuple(acronyms or ()), "-", str.lower)
 
 
 def const(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -107,8 +195,12 @@ def const(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> const("helloHTMLWorld", ["HTML"])
         'HELLO_HTML_WORLD'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "_".join([w.upper() for w in words])
+    if not acronyms:
+        if _IS_UPPER_WORDS(text):
+            return _replace_separators(text, "_")
+        if _IS_LOWER_WORDS(text):
+            return _replace_separators(text, "_").upper()
+    return _join_cased(text, tuple(acronyms or ()), "_", str.upper)
 
 
 def dot(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -127,8 +219,9 @@ def dot(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> dot("helloHTMLWorld", ["HTML"])
         'hello.html.world'
     """
-    words, *_ = parse_case(text, acronyms)
-    return ".".join([w.lower() for w in words])
+    if not acronyms and _IS_LOWER_WORDS(text):
+        return _replace_separators(text, ".")
+    return _join_cased(text, tuple(acronyms or ()), ".", str.lower)
 
 
 def separate_words(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -147,8 +240,9 @@ def separate_words(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> separate_words("helloHTMLWorld", ["HTML"])
         'hello HTML World'
     """
-    words, *_ = parse_case(text, acronyms, preserve_case=True)
-    return " ".join(words)
+    if not acronyms and (_IS_LOWER_WORDS(text) or _IS_UPPER_WORDS(text)):
+        return _replace_separators(text, " ")
+    return _join_cased(text, tuple(acronyms or ()), " ", None, True)
 
 
 def slash(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -167,8 +261,9 @@ def slash(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> slash("helloHTMLWorld", ["HTML"])
         'hello/HTML/World'
     """
-    words, *_ = parse_case(text, acronyms, preserve_case=True)
-    return "/".join(words)
+    if not acronyms and (_IS_LOWER_WORDS(text) or _IS_UPPER_WORDS(text)):
+        return _replace_separators(text, "/")
+    return _join_cased(text, tuple(acronyms or ()), "/", None, True)
 
 
 def backslash(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -187,8 +282,9 @@ def backslash(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> backslash("helloHTMLWorld", ["HTML"])
         r'hello\HTML\World'
     """
-    words, *_ = parse_case(text, acronyms, preserve_case=True)
-    return "\\".join(words)
+    if not acronyms and (_IS_LOWER_WORDS(text) or _IS_UPPER_WORDS(text)):
+        return _replace_separators(text, "\\")
+    return _join_cased(text, tuple(acronyms or ()), "\\", None, True)
 
 
 def ada(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -209,8 +305,7 @@ def ada(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> ada("helloHTMLWorld", ["HTML"])
         Hello_HTML_World
     """
-    words, *_ = parse_case(text, acronyms)
-    return "_".join([w.capitalize() for w in words])
+    return _join_cased(text, tuple(acronyms or ()), "_", str.capitalize)
 
 
 def http_header(text: str, acronyms: Optional[List[str]] = None) -> str:
@@ -229,11 +324,10 @@ def http_header(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> http_header("helloHTMLWorld", ["HTML"])
         Hello-HTML-World
     """
-    words, *_ = parse_case(text, acronyms)
-    return "-".join([w.capitalize() for w in words])
+    return _join_cased(text, tuple(acronyms or ()), "-", str.capitalize)
 
 
-def lower(text: str, *args, **kwargs) -> str:
+def lower(text: str, acronyms: Optional[List[str]] = None) -> str:
     """Return text in lowercase style.
 
     This is a convenience function wrapping inbuilt lower().
@@ -242,8 +336,8 @@ def lower(text: str, *args, **kwargs) -> str:
 
     Args:
         text (str): Input string to be converted
-        args : Placeholder to conform to common signature
-        kwargs : Placeholder to conform to common signature
+        acronyms (optional, list of str): Placeholder to conform to common
+            signature
 
     Returns:
         str: Case converted text
@@ -257,7 +351,7 @@ def lower(text: str, *args, **kwargs) -> str:
     return text.lower()
 
 
-def upper(text: str, *args, **kwargs) -> str:
+def upper(text: str, acronyms: Optional[List[str]] = None) -> str:
     """Return text in UPPERCASE style.
 
     This is a convenience function wrapping inbuilt upper().
@@ -266,8 +360,8 @@ def upper(text: str, *args, **kwargs) -> str:
 
     Args:
         text (str): Input string to be converted
-        args : Placeholder to conform to common signature
-        kwargs : Placeholder to conform to common signature
+        acronyms (optional, list of str): Placeholder to conform to common
+            signature
 
     Returns:
         str: Case converted text
@@ -281,7 +375,7 @@ def upper(text: str, *args, **kwargs) -> str:
     return text.upper()
 
 
-def title(text: str, *args, **kwargs) -> str:
+def title(text: str, acronyms: Optional[List[str]] = None) -> str:
     """Return text in Title_case style.
 
     This is a convenience function wrapping inbuilt title().
@@ -290,8 +384,8 @@ def title(text: str, *args, **kwargs) -> str:
 
     Args:
         text (str): Input string to be converted
-        args : Placeholder to conform to common signature
-        kwargs : Placeholder to conform to common signature
+        acronyms (optional, list of str): Placeholder to conform to common
+            signature
 
     Returns:
         str: Case converted text
@@ -305,7 +399,7 @@ def title(text: str, *args, **kwargs) -> str:
     return text.title()
 
 
-def capital(text: str, *args, **kwargs) -> str:
+def capital(text: str, acronyms: Optional[List[str]] = None) -> str:
     """Return text in Capital case style.
 
     This is a convenience function wrapping inbuilt capitalize().
@@ -314,8 +408,8 @@ def capital(text: str, *args, **kwargs) -> str:
 
     Args:
         text (str): Input string to be converted
-        args : Placeholder to conform to common signature
-        kwargs : Placeholder to conform to common signature
+        acronyms (optional, list of str): Placeholder to conform to common
+            signature
 
     Returns:
         str: Case converted text
@@ -1,16 +1,79 @@
-from typing import List, Optional, Tuple
+import re
+import sys
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
 from .types import Case
 from .utils import (
     advanced_acronym_detection,
     determine_case,
-    is_upper,
     normalize_words,
     sanitize_acronyms,
     segment_string,
     simple_acronym_detection,
 )
 
+# Matches two adjacent ASCII upper-case letters, or any non-ASCII character
+# that might be one of a pair.
+_MAY_HAVE_LETTER_RUN = re.compile(r"[A-Z]{2}|[^\x00-\x7f]").search
+
+
+def _split_words(
+    string: str, acronyms: List[str]
+) -> Tuple[List[str], Case, str, bool]:
+    """Split a string into words, leaving their case untouched.
+
+    Args:
+        string (str): Input string to be converted
+        acronyms (list of str): Sanitized acronyms to honor
+
+    Returns:
+        list of str: Segmented input string
+        Case: Determined case
+        str: Determined seperator
+        bool: Whether the string was upper-case
+    """
+    words_with_sep, separator, was_upper = segment_string(string)
+
+    if acronyms:
+        # Use advanced acronym detection with list
+        check_acronym = advanced_acronym_detection  # type: ignore
+    else:
+        # Fallback to simple acronym detection.
+        check_acronym = simple_acronym_detection  # type: ignore
+
+    # Letter-run detector
+
+    # Runs of a single letter are left as they are by both acronym
+    # detections, so there is nothing to do unless the string has two
+    # adjacent upper-case letters.
+    if _MAY_HAVE_LETTER_RUN(string):
+        # Index of current word.
+        i = 0
+        # Index of first letter in run.
+        s = None
+
+        # Find runs of single upper-case letters. Words only consist of
+        # upper-case, lower-case and decimal characters, of which only the
+        # first are isupper(), so this is is_upper() without a call per word.
+        while i < len(words_with_sep):
+            word = words_with_sep[i]
+            if word is not None and len(word) == 1 and word.isupper():
+                if s is None:
+                    s = i
+            elif s is not None:
+                i = check_acronym(s, i, words_with_sep, acronyms) + 1  # type: ignore
+                s = None
+            i += 1
+
+    # Separators are no longer needed, so they should be removed.
+    words: List[str] = [w for w in words_with_sep if w is not None]
+
+    # Determine case type.
+    case_type = determine_case(was_upper, words, string)
+
+    return words, case_type, separator, was_upper
+
 
 def parse_case(
     string: str, acronyms: Optional[List[str]] = None, preserve_case: bool = False,
@@ -35,45 +98,73 @@ def parse_case(
         >>> parse_case("helloHtmlWorld", ["HTML"], True)
         ["Hello", "Html", World"], Case.CAMEL, None
     """
-    words_with_sep, separator, was_upper = segment_string(string)
+    normalized, preserved, case_type, separator = _parse_case_cached(
+        string, tuple(acronyms or ())
+    )
+    # Hand out a fresh list, so callers can't alter cached results.
+    return list(preserved if preserve_case else normalized), case_type, separator
 
-    if acronyms:
-        # Use advanced acronym detection with list
-        acronyms = sanitize_acronyms(acronyms)
-        check_acronym = advanced_acronym_detection  # type: ignore
-    else:
-        acronyms = []
-        # Fallback to simple acronym detection.
-        check_acronym = simple_acronym_detection  # type: ignore
 
-    # Letter-run detector
+# Single ASCII words in all lower- or all upper-case are parsed without
+# running the segmenter.
+_IS_LOWER_WORD = re.compile(r"[a-z][a-z0-9]*").fullmatch
+_IS_UPPER_WORD = re.compile(r"[A-Z][A-Z0-9]*").fullmatch
 
-    # Index of current word.
-    i = 0
-    # Index of first letter in run.
-    s = None
-
-    # Find runs of single upper-case letters.
-    while i < len(words_with_sep):
-        word = words_with_sep[i]
-        if word is not None and is_upper(word):
-            if s is None:
-                s = i
-        elif s is not None:
-            i = check_acronym(s, i, words_with_sep, acronyms) + 1  # type: ignore
-            s = None
-        i += 1
+# Cached words up to this length are interned, so recurring words ("id",
+# "url", ...) are shared between cache entries instead of duplicated.
+_INTERN_MAX_LEN = 16
 
-    # Separators are no longer needed, so they should be removed.
-    words: List[str] = [w for w in words_with_sep if w is not None]
 
-    # Determine case type.
-    case_type = determine_case(was_upper, words, string)
+def _intern_words(words: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(w) if len(w) <= _INTERN_MAX_LEN else w for w in words)
 
-    if preserve_case:
-        if was_upper:
-            words = [w.upper() for w in words]
-    else:
-        words = normalize_words(words, acronyms)
 
-    return words, case_type, separator
+@lru_cache(maxsize=128)
+def _sanitize_acronyms_cached(acronyms: Tuple[str, ...]) -> List[str]:
+    """Memoized variant of sanitize_acronyms, keyed on a tuple of acronyms.
+
+    Applications tend to pass the same acronyms over and over, so they only
+    need to be validated and upper-cased once. Duplicates are dropped, in
+    order, as they can't match anything the first occurrence didn't. The
+    returned list is shared and must not be mutated.
+    """
+    return list(dict.fromkeys(sanitize_acronyms(list(acronyms))))
+
+
+@lru_cache(maxsize=4096)
+def _parse_case_cached(
+    string: str, acronyms: Tuple[str, ...] = (),
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Case, str]:
+    """Memoized implementation of parse_case, keyed on hashable arguments.
+
+    A single parse yields both the normalized words and the words with
+    their case preserved, as parallel tuples, so conversions to either kind
+    of style share one cache entry. Tuples can't be mutated by callers.
+
+    Args:
+        string (str): Input string to be converted
+        acronyms (tuple of str): Acronyms to honor
+
+    Returns:
+        tuple of str: Segmented input string, normalized
+        tuple of str: Segmented input string, case preserved
+        Case: Determined case
+        str: Determined seperator
+    """
+    sanitized = _sanitize_acronyms_cached(acronyms)
+
+    if not string:
+        return (), (), Case.UNKOWN, ""
+    if not sanitized and (_IS_LOWER_WORD(string) or _IS_UPPER_WORD(string)):
+        case_type = Case.LOWER if string.islower() else Case.UPPER
+        word = string.capitalize()
+        # sys.intern only takes exact str, and a str subclass (e.g. a str
+        # Enum member) must not leak into the results, so copy its value.
+        # str() won't do: it returns an Enum member's name.
+        string = str.__str__(string)
+        return _intern_words((word,)), _intern_words((string,)), case_type, ""
+
+    words, case_type, separator, was_upper = _split_words(string, sanitized)
+    normalized = normalize_words(words, sanitized)
+    preserved: Iterable[str] = map(str.upper, words) if was_upper else words
+    return _intern_words(normalized), _intern_words(preserved), case_type, separator
@@ -110,15 +110,15 @@ def advanced_acronym_detection(
 
     # Search for each acronym in acr_str.
     for acr in acronyms:
+        if len(acr) > len(acr_str):
+            continue
         for (start, end) in get_rubstring_ranges(acr_str, acr):
-            # Make sure found acronym doesn't overlap with others.
-            for r in range_list:
-                if start < r[1] and end > r[0]:
-                    break
-            else:
+            # Make sure found acronym doesn't overlap with others, i.e. all
+            # of its letters are still remaining.
+            found = range(start, end)
+            if not_range.issuperset(found):
                 range_list.append((start, end))
-                for j in range(start, end):
-                    not_range.remove(j)
+                not_range.difference_update(found)
 
     # Add remaining letters as ranges.
     for nr in not_range:
@@ -128,14 +128,8 @@ def advanced_acronym_detection(
     # which sort() will do by default.
     range_list.sort()
 
-    # Remove original letters in word list.
-    for _ in range(s, i):
-        del words[s]
-
-    # Replace them with new word grouping.
-    for j in range(len(range_list)):
-        r = range_list[j]
-        words.insert(s + j, acr_str[r[0] : r[1]])
+    # Replace original letters in word list with new word grouping.
+    words[s:i] = [acr_str[start:end] for (start, end) in range_list]
 
     return s + len(range_list) - 1
 
@@ -153,15 +147,9 @@ def simple_acronym_detection(s: int, i: int, words: List[str], *args) -> int:
     Returns:
         int: Index of last letter in run
     """
-    # Combine each letter into a single string.
-    acr_str = "".join(words[s:i])
-
-    # Remove original letters in word list.
-    for _ in range(s, i):
-        del words[s]
-
-    # Replace them with new word grouping.
-    words.insert(s, "".join(acr_str))
+    # Replace the letters in word list with them combined into a single
+    # string.
+    words[s:i] = ["".join(words[s:i])]
 
     return s
 
@@ -210,6 +198,36 @@ def normalize_words(words: List[str], acronyms: List[str]) -> List[str]:
     return normalized
 
 
+# Character classes used by segment_string.
+_SEP, _LOWER, _UPPER, _DECIMAL = range(4)
+
+_CATEGORY_CLASSES = {"Ll": _LOWER, "Lu": _UPPER, "Nd": _DECIMAL}
+
+# Precomputed classes of the ASCII range, so only non-ASCII characters have
+# to go through unicodedata.
+_ASCII_CLASSES = bytes(
+    _CATEGORY_CLASSES.get(unicodedata.category(chr(code)), _SEP)
+    for code in range(128)
+)
+
+# _BOUNDARIES[prev][curr] tells whether there is a word boundary between two
+# adjacent characters of the given classes: before every upper-case letter
+# and on every transition from separator to not separator and back.
+_BOUNDARIES = (
+    (False, True, True, True),
+    (True, False, True, False),
+    (True, False, True, False),
+    (True, False, True, False),
+)
+
+
+def _char_class(a_char: str) -> int:
+    code = ord(a_char)
+    if code < 128:
+        return _ASCII_CLASSES[code]
+    return _CATEGORY_CLASSES.get(unicodedata.category(a_char), _SEP)
+
+
 def segment_string(string: str) -> Tuple[List[Optional[str]], str, bool]:
     """Segment string on separator into list of words.
 
@@ -224,13 +242,12 @@ def segment_string(string: str) -> Tuple[List[Optional[str]], str, bool]:
     words: List[Optional[str]] = []
     separator = ""
 
-    # curr_index of current character. Initially 1 because we don't
-    # want to check if the 0th character is a boundary.
-    curr_i = 1
-    # Index of first character in a sequence
-    seq_i = 0
-    # Previous character.
-    prev_i = string[0:1]
+    if not string:
+        return words, separator, False
+
+    # Class of the previous character. Taken before lower-casing, which
+    # may change the first character.
+    prev_class = _char_class(string[0])
 
     # Treat an all-caps string as lower-case, to prevent its
     # letters to be counted as boundaries
@@ -239,44 +256,39 @@ def segment_string(string: str) -> Tuple[List[Optional[str]], str, bool]:
         string = string.lower()
         was_upper = True
 
-    # Iterate over each character, checking for boundaries, or places
-    # where the string should divided.
-    while curr_i <= len(string):
-        char = string[curr_i : curr_i + 1]
-        split = False
+    classes = [_char_class(a_char) for a_char in string]
+    boundaries = _BOUNDARIES
+
+    # Index of first character in a sequence
+    seq_i = 0
+
+    # Walk the character classes, splitting the string on boundaries. Start
+    # at 1 because we don't want to check if the 0th character is a
+    # boundary. The last sequence is flushed after the loop.
+    for curr_i in range(1, len(string) + 1):
         if curr_i < len(string):
-            # Detect upper-case letter as boundary.
-            if char_is_upper(char):
-                split = True
-            # Detect transition from separator to not separator.
-            elif not char_is_sep(char) and char_is_sep(prev_i):
-                split = True
-            # Detect transition not separator to separator.
-            elif char_is_sep(char) and not char_is_sep(prev_i):
-                split = True
+            curr_class = classes[curr_i]
+            if not boundaries[prev_class][curr_class]:
+                prev_class = curr_class
+                continue
+        else:
+            curr_class = _SEP
+
+        if prev_class != _SEP:
+            words.append(string[seq_i:curr_i])
         else:
-            # The looprev_igoes one extra iteration so that it can
-            # handle the remaining text after the last boundary.
-            split = True
-
-        if split:
-            if not char_is_sep(prev_i):
-                words.append(string[seq_i:curr_i])
-            else:
-                # string contains at least one separator.
-                # Use the first one as the string's primary separator.
-                if not separator:
-                    separator = string[seq_i : seq_i + 1]
-
-                # Use None to indicate a separator in the word list.
-                words.append(None)
-                # If separators weren't included in the list, then breaks
-                # between upper-case sequences ("AAA_BBB") would be
-                # disregarded; the letter-run detector would count them
-                # as a single sequence ("AAABBB").
-            seq_i = curr_i
-
-        curr_i += 1
-        prev_i = char
+            # string contains at least one separator.
+            # Use the first one as the string's primary separator.
+            if not separator:
+                separator = string[seq_i : seq_i + 1]
+
+            # Use None to indicate a separator in the word list.
+            words.append(None)
+            # If separators weren't included in the list, then breaks
+            # between upper-case sequences ("AAA_BBB") would be
+            # disregarded; the letter-run detector would count them
+            # as a single sequence ("AAABBB").
+        seq_i = curr_i
+        prev_class = curr_class
 
     return words, separator, was_upper
@@ -0,0 +1,16 @@
+import pytest
+
+from case_conversion.converter import _camel, _join_cased
+from case_conversion.parser import _parse_case_cached, _sanitize_acronyms_cached
+
+_CACHES = (_parse_case_cached, _sanitize_acronyms_cached, _join_cased, _camel)
+
+
+@pytest.fixture
+def cold_caches():
+    """Run a test against empty conversion caches, and leave them empty."""
+    for cache in _CACHES:
+        cache.cache_clear()
+    yield
+    for cache in _CACHES:
+        cache.cache_clear()
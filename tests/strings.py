@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class Text(str):
+    """A plain str subclass."""
+
+
+class Style(str, Enum):
+    """A str Enum, whose str() is its name rather than its value."""
+
+    FOO = "foo"
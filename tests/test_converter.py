@@ -1,8 +1,13 @@
-from unittest import TestCase
+from itertools import chain
 
-from parameterized import parameterized
+import pytest
 
 import case_conversion
+from case_conversion import Case, parse_case
+from case_conversion.converter import _normalized_words
+from case_conversion.parser import _parse_case_cached
+
+from .strings import Style, Text
 
 ACRONYMS = ["HTTP"]
 ACRONYMS_UNICODE = ["HÉÉP"]
@@ -12,10 +17,10 @@ CASES = [
     "pascal",
     "snake",
     "dash",
-    "dash",
-    "const",
     "const",
     "dot",
+    "ada",
+    "http_header",
 ]
 
 CASES_PRESERVE = [
@@ -31,6 +36,8 @@ VALUES = {
     "dash": "foo-bar-string",
     "const": "FOO_BAR_STRING",
     "dot": "foo.bar.string",
+    "ada": "Foo_Bar_String",
+    "http_header": "Foo-Bar-String",
     "separate_words": "foo bar string",
     "slash": "foo/bar/string",
     "backslash": "foo\\bar\\string",
@@ -43,6 +50,8 @@ VALUES_UNICODE = {
     "dash": "fóo-bar-string",
     "const": "FÓO_BAR_STRING",
     "dot": "fóo.bar.string",
+    "ada": "Fóo_Bar_String",
+    "http_header": "Fóo-Bar-String",
     "separate_words": "fóo bar string",
     "slash": "fóo/bar/string",
     "backslash": "fóo\\bar\\string",
@@ -55,6 +64,8 @@ VALUES_SINGLE = {
     "dash": "foo",
     "const": "FOO",
     "dot": "foo",
+    "ada": "Foo",
+    "http_header": "Foo",
     "separate_words": "foo",
     "slash": "foo",
     "backslash": "foo",
@@ -67,6 +78,8 @@ VALUES_SINGLE_UNICODE = {
     "dash": "fóo",
     "const": "FÓO",
     "dot": "fóo",
+    "ada": "Fóo",
+    "http_header": "Fóo",
     "separate_words": "fóo",
     "slash": "fóo",
     "backslash": "fóo",
@@ -79,6 +92,8 @@ VALUES_ACRONYM = {
     "dash": "foo-http-bar-string",
     "const": "FOO_HTTP_BAR_STRING",
     "dot": "foo.http.bar.string",
+    "ada": "Foo_Http_Bar_String",
+    "http_header": "Foo-Http-Bar-String",
     "separate_words": "foo http bar string",
     "slash": "foo/http/bar/string",
     "backslash": "foo\\http\\bar\\string",
@@ -91,116 +106,119 @@ VALUES_ACRONYM_UNICODE = {
     "dash": "foo-héép-bar-string",
     "const": "FOO_HÉÉP_BAR_STRING",
     "dot": "foo.héép.bar.string",
+    "ada": "Foo_Héép_Bar_String",
+    "http_header": "Foo-Héép-Bar-String",
     "separate_words": "foo héép bar string",
     "slash": "foo/héép/bar/string",
     "backslash": "foo\\héép\\bar\\string",
 }
 
+# Words of the ASCII preserve-case tables and their counterparts in the
+# unicode tables.
+UNICODE_WORDS = {"foo": "fóo", "Foo": "Fóo", "FOO": "FÓO"}
+UNICODE_ACRONYM_WORDS = {"http": "héép", "Http": "Héép", "HTTP": "HÉÉP"}
+
+
+def _substitute(preserve_values, words):
+    """Return a copy of a preserve-case table with its words substituted."""
+    substituted = {}
+    for case, expected in preserve_values.items():
+        substituted[case] = {}
+        for name, value in expected.items():
+            for word, replacement in words.items():
+                value = value.replace(word, replacement)
+            substituted[case][name] = value
+    return substituted
+
+
 PRESERVE_VALUES = {
     "separate_words": {
         "camel": "foo Bar String",
         "pascal": "Foo Bar String",
         "const": "FOO BAR STRING",
+        "ada": "Foo Bar String",
+        "http_header": "Foo Bar String",
         "default": "foo bar string",
     },
     "slash": {
         "camel": "foo/Bar/String",
         "pascal": "Foo/Bar/String",
         "const": "FOO/BAR/STRING",
+        "ada": "Foo/Bar/String",
+        "http_header": "Foo/Bar/String",
         "default": "foo/bar/string",
     },
     "backslash": {
         "camel": "foo\\Bar\\String",
         "pascal": "Foo\\Bar\\String",
         "const": "FOO\\BAR\\STRING",
+        "ada": "Foo\\Bar\\String",
+        "http_header": "Foo\\Bar\\String",
         "default": "foo\\bar\\string",
     },
 }
 
-PRESERVE_VALUES_UNICODE = {
+PRESERVE_VALUES_UNICODE = _substitute(PRESERVE_VALUES, UNICODE_WORDS)
+
+PRESERVE_VALUES_SINGLE = {
     "separate_words": {
-        "camel": "fóo Bar String",
-        "pascal": "Fóo Bar String",
-        "const": "FÓO BAR STRING",
-        "default": "fóo bar string",
+        "camel": "foo",
+        "pascal": "Foo",
+        "const": "FOO",
+        "ada": "Foo",
+        "http_header": "Foo",
+        "default": "foo",
     },
     "slash": {
-        "camel": "fóo/Bar/String",
-        "pascal": "Fóo/Bar/String",
-        "const": "FÓO/BAR/STRING",
-        "default": "fóo/bar/string",
+        "camel": "foo",
+        "pascal": "Foo",
+        "const": "FOO",
+        "ada": "Foo",
+        "http_header": "Foo",
+        "default": "foo",
     },
     "backslash": {
-        "camel": "fóo\\Bar\\String",
-        "pascal": "Fóo\\Bar\\String",
-        "const": "FÓO\\BAR\\STRING",
-        "default": "fóo\\bar\\string",
-    },
-}
-
-PRESERVE_VALUES_SINGLE = {
-    "separate_words": {
         "camel": "foo",
         "pascal": "Foo",
         "const": "FOO",
+        "ada": "Foo",
+        "http_header": "Foo",
         "default": "foo",
     },
-    "slash": {"camel": "foo", "pascal": "Foo", "const": "FOO", "default": "foo",},
-    "backslash": {"camel": "foo", "pascal": "Foo", "const": "FOO", "default": "foo",},
 }
 
-PRESERVE_VALUES_SINGLE_UNICODE = {
-    "separate_words": {
-        "camel": "fóo",
-        "pascal": "Fóo",
-        "const": "FÓO",
-        "default": "fóo",
-    },
-    "slash": {"camel": "fóo", "pascal": "Fóo", "const": "FÓO", "default": "fóo",},
-    "backslash": {"camel": "fóo", "pascal": "Fóo", "const": "FÓO", "default": "fóo",},
-}
+PRESERVE_VALUES_SINGLE_UNICODE = _substitute(PRESERVE_VALUES_SINGLE, UNICODE_WORDS)
 
 PRESERVE_VALUES_ACRONYM = {
     "separate_words": {
         "camel": "foo HTTP Bar String",
         "pascal": "Foo HTTP Bar String",
         "const": "FOO HTTP BAR STRING",
+        "ada": "Foo Http Bar String",
+        "http_header": "Foo Http Bar String",
         "default": "foo http bar string",
     },
     "slash": {
         "camel": "foo/HTTP/Bar/String",
         "pascal": "Foo/HTTP/Bar/String",
         "const": "FOO/HTTP/BAR/STRING",
+        "ada": "Foo/Http/Bar/String",
+        "http_header": "Foo/Http/Bar/String",
         "default": "foo/http/bar/string",
     },
     "backslash": {
         "camel": "foo\\HTTP\\Bar\\String",
         "pascal": "Foo\\HTTP\\Bar\\String",
         "const": "FOO\\HTTP\\BAR\\STRING",
+        "ada": "Foo\\Http\\Bar\\String",
+        "http_header": "Foo\\Http\\Bar\\String",
         "default": "foo\\http\\bar\\string",
     },
 }
 
-PRESERVE_VALUES_ACRONYM_UNICODE = {
-    "separate_words": {
-        "camel": "foo HÉÉP Bar String",
-        "pascal": "Foo HÉÉP Bar String",
-        "const": "FOO HÉÉP BAR STRING",
-        "default": "foo héép bar string",
-    },
-    "slash": {
-        "camel": "foo/HÉÉP/Bar/String",
-        "pascal": "Foo/HÉÉP/Bar/String",
-        "const": "FOO/HÉÉP/BAR/STRING",
-        "default": "foo/héép/bar/string",
-    },
-    "backslash": {
-        "camel": "foo\\HÉÉP\\Bar\\String",
-        "pascal": "Foo\\HÉÉP\\Bar\\String",
-        "const": "FOO\\HÉÉP\\BAR\\STRING",
-        "default": "foo\\héép\\bar\\string",
-    },
-}
+PRESERVE_VALUES_ACRONYM_UNICODE = _substitute(
+    PRESERVE_VALUES_ACRONYM, UNICODE_ACRONYM_WORDS
+)
 
 
 PRESERVE_VALUES_ACRONYM_SINGLE = {
@@ -219,166 +237,189 @@ PRESERVE_VALUES_ACRONYM_SINGLE = {
     },
 }
 
-CAPITAL_CASES = [
-    "camel",
-    "pascal",
-    "const",
-    "const",
+_CONVERTERS = {case: getattr(case_conversion, case) for case in CASES + CASES_PRESERVE}
+
+CAPITAL_CASES = frozenset(["camel", "pascal", "const", "ada", "http_header"])
+
+# (name, values, acronyms) of the tables for cases that don't preserve
+# capital/lower case letters.
+VALUE_TABLES = [
+    ("plain", VALUES, None),
+    ("unicode", VALUES_UNICODE, None),
+    ("single", VALUES_SINGLE, None),
+    ("single_unicode", VALUES_SINGLE_UNICODE, None),
+    ("acronym", VALUES_ACRONYM, ACRONYMS),
+    ("acronym_unicode", VALUES_ACRONYM_UNICODE, ACRONYMS_UNICODE),
+]
+
+# (name, preserve_values, values, acronyms) of the tables for cases that do
+# preserve capital/lower case letters.
+PRESERVE_VALUE_TABLES = [
+    ("plain", PRESERVE_VALUES, VALUES, None),
+    ("unicode", PRESERVE_VALUES_UNICODE, VALUES_UNICODE, None),
+    ("single", PRESERVE_VALUES_SINGLE, VALUES_SINGLE, None),
+    ("single_unicode", PRESERVE_VALUES_SINGLE_UNICODE, VALUES_SINGLE_UNICODE, None),
+    ("acronym", PRESERVE_VALUES_ACRONYM, VALUES_ACRONYM, ACRONYMS),
+    (
+        "acronym_unicode",
+        PRESERVE_VALUES_ACRONYM_UNICODE,
+        VALUES_ACRONYM_UNICODE,
+        ACRONYMS_UNICODE,
+    ),
 ]
 
 
-def _expand_values(values):
-    test_params = []
+def _expand_values(table, values, acronyms):
     for case in CASES:
-        test_params.extend(
-            [
-                (name + "2" + case, case, value, values[case])
-                for name, value in values.items()
-            ]
-        )
-        test_params.append((case + "_empty", case, "", ""))
-    return test_params
+        converter = _CONVERTERS[case]
+        for name, value in values.items():
+            yield pytest.param(
+                converter, value, values[case], acronyms, id=f"{table}_{name}2{case}"
+            )
+        yield pytest.param(converter, "", "", acronyms, id=f"{table}_{case}_empty")
 
 
-def _expand_values_preserve(preserve_values, values):
-    test_params = []
+def _expand_values_preserve(table, preserve_values, values, acronyms):
     for case in CASES_PRESERVE:
-        test_params.extend(
-            [
-                (
-                    name + "2" + case,
-                    case,
-                    value,
-                    preserve_values[case][name if name in CAPITAL_CASES else "default"],
-                )  # nopep8
-                for name, value in values.items()
-            ]
+        converter = _CONVERTERS[case]
+        for name, value in values.items():
+            key = name if name in CAPITAL_CASES else "default"
+            expected = preserve_values[case][key]
+            yield pytest.param(
+                converter, value, expected, acronyms, id=f"{table}_{name}2{case}"
+            )
+        yield pytest.param(converter, "", "", acronyms, id=f"{table}_{case}_empty")
+
+
+VALUES_IRREGULAR = {
+    "snake": ("_foo__bar_", "foo_bar"),
+    "dash": ("-foo--bar-", "foo-bar"),
+    "const": ("_FOO__BAR_", "FOO_BAR"),
+}
+
+VALUES_SPECIAL_CASING = {
+    "snake": ("İstanbulCity", "i̇stanbul_city"),
+    "const": ("İstanbulCity", "İSTANBUL_CITY"),
+    "dot": ("ΑΣ_Β", "ας.β"),
+    "pascal": ("straße_name", "StraßeName"),
+}
+
+
+@pytest.mark.parametrize(
+    "converter,value,expected,acronyms",
+    list(chain.from_iterable(_expand_values(*table) for table in VALUE_TABLES)),
+)
+def test_conversion(converter, value, expected, acronyms):
+    """
+    Test conversions from all cases to all cases that don't preserve
+    capital/lower case letters, for each table of values (single words,
+    unicode characters, acronym detection).
+    """
+    assert converter(value, acronyms=acronyms) == expected
+
+
+@pytest.mark.parametrize(
+    "converter,value,expected,acronyms",
+    list(
+        chain.from_iterable(
+            _expand_values_preserve(*table) for table in PRESERVE_VALUE_TABLES
+        )
+    ),
+)
+def test_preserve_case(converter, value, expected, acronyms):
+    """
+    Test conversions from all cases to all cases that do preserve
+    capital/lower case letters, for each table of values (single words,
+    unicode characters, acronym detection).
+    """
+    assert converter(value, acronyms=acronyms) == expected
+
+
+@pytest.mark.parametrize(
+    "converter,value,expected",
+    [
+        pytest.param(_CONVERTERS[case], value, expected, id=f"{table}_{case}")
+        for table, values in (
+            ("irregular", VALUES_IRREGULAR),
+            ("special_casing", VALUES_SPECIAL_CASING),
         )
-        test_params.append((case + "_empty", case, "", ""))
-    return test_params
-
-
-class CaseConversionTest(TestCase):
-    @parameterized.expand(_expand_values(VALUES))
-    def test(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that don't preserve
-        capital/lower case letters.
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(_expand_values(VALUES_UNICODE))
-    def test_unicode(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that don't preserve
-        capital/lower case letters (with unicode characters).
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(_expand_values(VALUES_SINGLE))
-    def test_single(self, _, case, value, expected):
-        """
-        Test conversions of single words from all cases to all cases that
-        don't preserve capital/lower case letters.
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(_expand_values(VALUES_SINGLE_UNICODE))
-    def test_single_unicode(self, _, case, value, expected):
-        """
-        Test conversions of single words from all cases to all cases that
-        don't preserve capital/lower case letters (with unicode characters).
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(_expand_values_preserve(PRESERVE_VALUES, VALUES))
-    def test_preserve_case(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that do preserve
-        capital/lower case letters.
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(
-        _expand_values_preserve(PRESERVE_VALUES_UNICODE, VALUES_UNICODE)
-    )
-    def test_preserve_case_unicode(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that do preserve
-        capital/lower case letters (with unicode characters).
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(
-        _expand_values_preserve(PRESERVE_VALUES_SINGLE, VALUES_SINGLE)
-    )
-    def test_preserve_case_single(self, _, case, value, expected):
-        """
-        Test conversions of single words from all cases to all cases that do
-        preserve capital/lower case letters.
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(
-        _expand_values_preserve(PRESERVE_VALUES_SINGLE_UNICODE, VALUES_SINGLE_UNICODE)
-    )
-    def test_preserve_case_single_unicode(self, _, case, value, expected):
-        """
-        Test conversions of single words from all cases to all cases that do
-        preserve capital/lower case letters (with unicode characters).
-        """
-        case_converter = getattr(case_conversion, case)
-        self.assertEqual(case_converter(value), expected)
-
-    @parameterized.expand(_expand_values(VALUES_ACRONYM))
-    def test_acronyms(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that don't preserve
-        capital/lower case letters (with acronym detection).
-        """
-        case_converter = getattr(case_conversion, case)
-        result = case_converter(value, acronyms=ACRONYMS)
-        self.assertEqual(result, expected)
-
-    @parameterized.expand(_expand_values(VALUES_ACRONYM_UNICODE))
-    def test_acronyms_unicode(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that don't preserve
-        capital/lower case letters (with acronym detection and unicode
-        characters).
-        """
-        case_converter = getattr(case_conversion, case)
-        result = case_converter(value, acronyms=ACRONYMS_UNICODE)
-        self.assertEqual(result, expected)
-
-    @parameterized.expand(
-        _expand_values_preserve(PRESERVE_VALUES_ACRONYM, VALUES_ACRONYM)
-    )
-    def test_acronyms_preserve_case(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that do preserve
-        capital/lower case letters (with acronym detection).
-        """
-        case_converter = getattr(case_conversion, case)
-        result = case_converter(value, acronyms=ACRONYMS)
-        self.assertEqual(result, expected)
-
-    @parameterized.expand(
-        _expand_values_preserve(PRESERVE_VALUES_ACRONYM_UNICODE, VALUES_ACRONYM_UNICODE)
-    )
-    def test_acronyms_preserve_case_unicode(self, _, case, value, expected):
-        """
-        Test conversions from all cases to all cases that do preserve
-        capital/lower case letters (with acronym detection and unicode
-        characters).
-        """
-        case_converter = getattr(case_conversion, case)
-        result = case_converter(value, acronyms=ACRONYMS_UNICODE)
-        self.assertEqual(result, expected)
+        for case, (value, expected) in values.items()
+    ],
+)
+def test_irregular_values(converter, value, expected):
+    """
+    Test conversions collapse leading, trailing and repeated separators, and
+    handle letters whose case mappings change their length or depend on
+    context.
+    """
+    assert converter(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "fooBarString",
+        "FooBarString",
+        "fooBARString",
+        "HTTPError",
+        "getHTTPResponse",
+        "ABCdef",
+        "aBC",
+        "fooB",
+        "foo1Bar2",
+        "v2API",
+        "123",
+        "foo_123_bar",
+        "1foo",
+        "foo_bar",
+        "_foo__bar_",
+        "foo bar/baz\\qux.quux-corge",
+        "x_Y_z",
+        "FOO_BAR",
+        "FOOBAR",
+        "FOO1_BAR2",
+        "A",
+        "a",
+        "",
+        "_",
+        "-_. /\\",
+        "Foo_BAR_baz",
+    ),
+)
+def test_normalized_words_match_parse_case(value):
+    """
+    Test the ASCII word splitting of the converters agrees with parse_case.
+    """
+    assert list(_normalized_words(value, ())) == parse_case(value)[0]
+
+
+@pytest.mark.usefixtures("cold_caches")
+def test_camel_leaves_parsed_words_untouched():
+    """
+    Test camelCase and PascalCase conversions leave the cached parse they
+    take their words from unchanged.
+    """
+    expected = (("HTTP", "Foo", "Bar"), ("HTTP", "Foo", "Bar"), Case.PASCAL, "")
+    parsed = _parse_case_cached("HTTPFooBar", ("HTTP",))
+    assert parsed == expected
+
+    hits = _parse_case_cached.cache_info().hits
+    assert case_conversion.camel("HTTPFooBar", ["HTTP"]) == "httpFooBar"
+    assert case_conversion.pascal("HTTPFooBar", ["HTTP"]) == "HTTPFooBar"
+    assert _parse_case_cached.cache_info().hits == hits + 2
+
+    assert _parse_case_cached("HTTPFooBar", ("HTTP",)) is parsed
+    assert _parse_case_cached.cache_info().hits == hits + 3
+    assert parsed == expected
+
+
+@pytest.mark.parametrize("value", (Text("foo"), Style.FOO))
+@pytest.mark.parametrize("case", CASES + CASES_PRESERVE)
+@pytest.mark.usefixtures("cold_caches")
+def test_str_subclass(case, value):
+    """
+    Test conversions of str subclasses return plain str.
+    """
+    result = _CONVERTERS[case](value)
+    assert type(result) is str
+    assert result == VALUES_SINGLE[case]
@@ -1,16 +1,68 @@
 import pytest
 
 from case_conversion import Case, parse_case
+from case_conversion.parser import _parse_case_cached
+
+from .strings import Style, Text
+
+FOO_BAR_BAZ = (["Foo", "Bar", "Baz"], Case.CAMEL, "")
+FOO_BAR_BAZ_PRESERVED = (["foo", "Bar", "Baz"], Case.CAMEL, "")
 
 
 @pytest.mark.parametrize(
     "string,acronyms,preserve_case,expected",
     (
-        ("fooBarBaz", None, False, (["Foo", "Bar", "Baz"], Case.CAMEL, "")),
-        ("fooBarBaz", None, True, (["foo", "Bar", "Baz"], Case.CAMEL, "")),
+        ("fooBarBaz", None, False, FOO_BAR_BAZ),
+        ("fooBarBaz", None, True, FOO_BAR_BAZ_PRESERVED),
         ("fooBarBaz", ("BAR",), False, (["Foo", "BAR", "Baz"], Case.CAMEL, "")),
-        ("fooBarBaz", ("BAR",), True, (["foo", "Bar", "Baz"], Case.CAMEL, "")),
+        ("fooBarBaz", ("BAR",), True, FOO_BAR_BAZ_PRESERVED),
     ),
 )
 def test_parse_case(string, acronyms, preserve_case, expected):
     assert parse_case(string, acronyms, preserve_case) == expected
+
+
+@pytest.mark.parametrize(
+    "string,acronyms,expected",
+    (
+        (
+            "fooBarBaz",
+            (),
+            (("Foo", "Bar", "Baz"), ("foo", "Bar", "Baz"), Case.CAMEL, ""),
+        ),
+        (
+            "fooBarBaz",
+            ("BAR",),
+            (("Foo", "BAR", "Baz"), ("foo", "Bar", "Baz"), Case.CAMEL, ""),
+        ),
+        ("FOO_BAR", (), (("Foo", "Bar"), ("FOO", "BAR"), Case.UPPER, "_")),
+    ),
+)
+def test_parse_case_cached(string, acronyms, expected):
+    result = _parse_case_cached(string, acronyms)
+    assert result == expected
+    hits = _parse_case_cached.cache_info().hits
+    assert _parse_case_cached(string, acronyms) is result
+    assert _parse_case_cached.cache_info().hits == hits + 1
+
+
+def test_parse_case_returns_fresh_words():
+    words, *_ = parse_case("fooBarBaz")
+    words.append("Qux")
+    assert parse_case("fooBarBaz") == FOO_BAR_BAZ
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    (
+        (Text("foo"), (["Foo"], Case.LOWER, "")),
+        (Text("FOO"), (["Foo"], Case.UPPER, "")),
+        (Text("fooBar"), (["Foo", "Bar"], Case.CAMEL, "")),
+        (Style.FOO, (["Foo"], Case.LOWER, "")),
+    ),
+)
+@pytest.mark.usefixtures("cold_caches")
+def test_parse_case_str_subclass(string, expected):
+    assert parse_case(string) == expected
+    words, *_ = parse_case(string, preserve_case=True)
+    assert [type(word) for word in words] == [str] * len(words)
@@ -18,6 +18,11 @@ from case_conversion import Case, InvalidAcronymError
         ("foo\\bar\\string", (["foo", None, "bar", None, "string"], "\\", False)),
         ("foobarstring", (["foobarstring"], "", False)),
         ("FOOBARSTRING", (["foobarstring"], "", True)),
+        ("fóoBarString", (["fóo", "Bar", "String"], "", False)),
+        ("ÓÓ_BAR", (["óó", None, "bar"], "_", True)),
+        ("foo1Bar2", (["foo1", "Bar2"], "", False)),
+        ("_foo__bar", ([None, "foo", None, "bar"], "_", False)),
+        ("", ([], "", False)),
     ),
 )
 def test_segment_string(string, expected):
@@ -44,12 +49,19 @@ def test_sanitize_acronyms(acronyms, expected):
         # TODO: Add more cases
         (0, 1, ["FOO", "bar"], 0),
         (1, 2, ["foo", "BAR", "baz"], 1),
+        (1, 4, ["foo", "B", "A", "R", "baz"], 1),
     ),
 )
 def test_simple_acronym_detection(s, i, words, expected):
     assert utils.simple_acronym_detection(s, i, words) == expected
 
 
+def test_simple_acronym_detection_merges_run():
+    words = ["foo", "B", "A", "R", "baz"]
+    utils.simple_acronym_detection(1, 4, words)
+    assert words == ["foo", "BAR", "baz"]
+
+
 @pytest.mark.parametrize(
     "s,i,words,acronyms,expected",
     (